@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import socket
+import struct
+from typing import Dict, Optional, Tuple
+
+"""
+直接在 raw socket 上说 MBAP + FC3 的精简 Modbus TCP 客户端。
+
+跳过 pymodbus 的事务管理和 framer 状态机：每次读取就是一个 12 字节请求加
+定长响应，全部用预编译 struct 解析。只实现本项目需要的
+read_holding_registers；出错直接抛异常，由调用方决定是否回退 pymodbus。
+"""
+
+# tid, pid(=0), length(=6), unit_id, fc(=3), address, count
+_REQUEST = struct.Struct(">HHHBBHH")
+# tid, pid, length, unit_id, fc
+_RESP_HEAD = struct.Struct(">HHHB")
+
+
+class FastModbusTcp:
+	def __init__(self, host: str, *, port: int = 502, timeout: Optional[float] = None) -> None:
+		self.host = host
+		self.port = port
+		# None 不能直接透传：那是完全阻塞的 socket，对端悄悄挂掉会把
+		# _recv_exact 卡死。默认对齐 pymodbus 的 3 秒。
+		self.timeout = 3.0 if timeout is None else timeout
+		self._sock: Optional[socket.socket] = None
+		self._tid = 0
+		self._unpack_cache: Dict[int, struct.Struct] = {}
+
+	def connect(self) -> bool:
+		self.close()
+		sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+		sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		try:
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)  # Linux only
+		except (AttributeError, OSError):
+			pass
+		# 内核层 keepalive，和 pymodbus 路径的 _tune_socket 保持一致：
+		# 对端掉线 ~4 秒内发现，不用在 Python 里做重试探测。
+		try:
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 1)
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+		except (AttributeError, OSError):
+			pass
+		self._sock = sock
+		return True
+
+	def close(self) -> None:
+		if self._sock is not None:
+			try:
+				self._sock.close()
+			except OSError:
+				pass
+			self._sock = None
+
+	@property
+	def connected(self) -> bool:
+		return self._sock is not None
+
+	def _recv_exact(self, n: int) -> bytes:
+		assert self._sock is not None
+		chunks = []
+		while n > 0:
+			chunk = self._sock.recv(n)
+			if not chunk:
+				raise ConnectionError("modbus peer closed the connection")
+			chunks.append(chunk)
+			n -= len(chunk)
+		return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+	def _read_fc3(self, device_id: int, address: int, count: int) -> bytes:
+		# 发一个 FC3 请求并返回响应 PDU（fc + byte_count + data）。
+		# 任何失败（超时、tid 不匹配、异常响应、短响应）都把连接作废：
+		# 迟到的响应还留在缓冲区里，不断线的话后续每次读都会错位。
+		if self._sock is None:
+			raise ConnectionError("not connected")
+		self._tid = tid = (self._tid + 1) & 0xFFFF
+		try:
+			self._sock.sendall(_REQUEST.pack(tid, 0, 6, device_id, 3, address, count))
+
+			# MBAP 头 7 字节；length 包含 unit_id + PDU。
+			head = self._recv_exact(_RESP_HEAD.size)
+			resp_tid, _pid, length, _unit = _RESP_HEAD.unpack(head)
+			pdu = self._recv_exact(length - 1)
+			if resp_tid != tid:
+				raise ConnectionError(f"transaction id mismatch: sent {tid}, got {resp_tid}")
+			fc = pdu[0]
+			if fc & 0x80:
+				raise ConnectionError(f"modbus exception response: function=0x{fc:02x}, code={pdu[1]}")
+			byte_count = pdu[1]
+			if byte_count != 2 * count or len(pdu) < 2 + byte_count:
+				raise ConnectionError(f"short modbus response: expected {2 * count} data bytes, got {byte_count}")
+		except Exception:
+			self.close()  # connected 变 False，上层 _ensure_connected 会重连
+			raise
+		return pdu
+
+	def _unpack(self, key: str, count: int, pdu: bytes) -> Tuple[int, ...]:
+		cache_key = count if key == "H" else -count
+		unpack = self._unpack_cache.get(cache_key)
+		if unpack is None:
+			unpack = self._unpack_cache[cache_key] = struct.Struct(f">{count}{key}")
+		return unpack.unpack_from(pdu, 2)
+
+	def read_holding_registers(self, *, device_id: int, address: int, count: int = 1) -> Tuple[int, ...]:
+		return self._unpack("H", count, self._read_fc3(device_id, address, count))
+
+	def read_holding_registers_signed(self, *, device_id: int, address: int, count: int = 1) -> Tuple[int, ...]:
+		# 直接按有符号 int16 解析原始字节，调用方不用再做 u16 -> s16。
+		return self._unpack("h", count, self._read_fc3(device_id, address, count))
@@ -1,48 +1,57 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 CONFIG_PATH = Path(__file__).parent / "config.json"
 
+# Strips all whitespace in one C-level pass before tokenizing ID lists.
+_WS_TABLE = str.maketrans("", "", " \t\r\n")
 
-@dataclass
+
+@dataclass(slots=True)
 class AppConfig:
 	sensor_ip: str = "10.10.10.2"
 	sensor_port: int = 502
 	address: int = 0
-	axis_device_ids: List[int] = None  # type: ignore[assignment]
+	axis_device_ids: List[int] = field(default_factory=lambda: [1, 2, 3])
 	timeout_s: float = 1.0
 	force_range_n: float = 20.0
 	counts_full_scale: float = 32768.0
 	poll_interval_ms: int = 50
 	language: str = "zh"  # "zh" or "en"
-
-	def __post_init__(self) -> None:
-		if self.axis_device_ids is None:
-			self.axis_device_ids = [1, 2, 3]
+	# Derived value, computed once on first use; its inputs are never mutated
+	# after construction (apply_updates builds fresh objects).
+	_n_per_count: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
 	def n_per_count(self) -> float:
-		return float(self.force_range_n) / float(self.counts_full_scale)
+		v = self._n_per_count
+		if v is None:
+			v = self._n_per_count = float(self.force_range_n) / float(self.counts_full_scale)
+		return v
+
+	def poll_hz(self) -> float:
+		return 1000.0 / float(self.poll_interval_ms) if self.poll_interval_ms > 0 else 0.0
 
 	def to_public_dict(self) -> Dict[str, Any]:
-		# Only expose what the UI edits.
-		poll_hz = 1000.0 / float(self.poll_interval_ms) if self.poll_interval_ms > 0 else 0.0
+		# Only expose what the UI edits. Built fresh each time: these only run
+		# on Save clicks and the class is not frozen, so caching them would go
+		# stale on in-place mutation.
 		return {
 			"sensor_ip": self.sensor_ip,
 			"sensor_port": self.sensor_port,
 			"axis_device_ids": self.axis_device_ids,
 			"force_range_n": self.force_range_n,
-			"poll_hz": poll_hz,
+			"poll_hz": self.poll_hz(),
 			"language": self.language,
 		}
 
 	def to_file_dict(self) -> Dict[str, Any]:
 		# Keep internal fields too.
-		poll_hz = 1000.0 / float(self.poll_interval_ms) if self.poll_interval_ms > 0 else 0.0
 		return {
 			"sensor_ip": self.sensor_ip,
 			"sensor_port": self.sensor_port,
@@ -52,7 +61,7 @@ class AppConfig:
 			"force_range_n": self.force_range_n,
 			"counts_full_scale": self.counts_full_scale,
 			"poll_interval_ms": self.poll_interval_ms,
-			"poll_hz": poll_hz,
+			"poll_hz": self.poll_hz(),
 			"language": self.language,
 			"n_per_count": self.n_per_count(),
 		}
@@ -62,68 +71,102 @@ def _coerce_int_list(value: Any, *, default: Optional[List[int]] = None) -> List
 	if value is None:
 		return default or [1, 2, 3]
 	if isinstance(value, list):
-		return [int(x) for x in value]
+		return list(map(int, value))
 	if isinstance(value, str):
-		parts = [p.strip() for p in value.split(",") if p.strip()]
-		return [int(p) for p in parts]
+		# Drop whitespace with translate (C-level), then split; the predicate
+		# only skips empty tokens (trailing commas etc.).
+		cleaned = value.translate(_WS_TABLE)
+		return [int(p) for p in cleaned.split(",") if p]
 	raise ValueError("axis_device_ids must be a list or comma-separated string")
 
 
+# mtime-keyed cache so repeat loads of an unchanged file skip the JSON parse.
+_LOAD_CACHE: Dict[Path, Tuple[int, AppConfig]] = {}
+
+
+def _cache_copy(cfg: AppConfig) -> AppConfig:
+	# Shallow replace plus a fresh list so callers can't mutate the cached entry.
+	return replace(cfg, axis_device_ids=list(cfg.axis_device_ids))
+
+
 def load_config(path: Path = CONFIG_PATH) -> AppConfig:
-	cfg = AppConfig()
-	if not path.exists():
-		return cfg
+	base = AppConfig()
+	try:
+		st = path.stat()
+	except OSError:
+		return base
+	cached = _LOAD_CACHE.get(path)
+	if cached is not None and cached[0] == st.st_mtime_ns:
+		return _cache_copy(cached[1])
 	data = json.loads(path.read_text(encoding="utf-8"))
 	if not isinstance(data, dict):
-		return cfg
-
-	cfg.sensor_ip = str(data.get("sensor_ip", cfg.sensor_ip))
-	cfg.sensor_port = int(data.get("sensor_port", cfg.sensor_port))
-	cfg.address = int(data.get("address", cfg.address))
-	cfg.axis_device_ids = _coerce_int_list(data.get("axis_device_ids"), default=cfg.axis_device_ids)
-	cfg.timeout_s = float(data.get("timeout_s", cfg.timeout_s))
-	cfg.force_range_n = float(data.get("force_range_n", data.get("range_n", cfg.force_range_n)))
-	cfg.counts_full_scale = float(data.get("counts_full_scale", cfg.counts_full_scale))
+		return base
+
+	# Collect everything first and construct once, so derived values cached on
+	# the instance can never observe a half-populated config.
+	poll_interval_ms = base.poll_interval_ms
 	if "poll_hz" in data and data.get("poll_hz"):
 		try:
 			hz = float(data.get("poll_hz"))
 			if hz > 0:
-				cfg.poll_interval_ms = int(round(1000.0 / hz))
+				poll_interval_ms = int(round(1000.0 / hz))
 		except Exception:
-			cfg.poll_interval_ms = int(data.get("poll_interval_ms", cfg.poll_interval_ms))
+			poll_interval_ms = int(data.get("poll_interval_ms", poll_interval_ms))
 	else:
-		cfg.poll_interval_ms = int(data.get("poll_interval_ms", cfg.poll_interval_ms))
-	cfg.language = str(data.get("language", cfg.language)) or "zh"
-	if cfg.language not in ("zh", "en"):
-		cfg.language = "zh"
+		poll_interval_ms = int(data.get("poll_interval_ms", poll_interval_ms))
+	language = str(data.get("language", base.language)) or "zh"
+	if language not in ("zh", "en"):
+		language = "zh"
+
+	cfg = AppConfig(
+		sensor_ip=str(data.get("sensor_ip", base.sensor_ip)),
+		sensor_port=int(data.get("sensor_port", base.sensor_port)),
+		address=int(data.get("address", base.address)),
+		axis_device_ids=_coerce_int_list(data.get("axis_device_ids"), default=base.axis_device_ids),
+		timeout_s=float(data.get("timeout_s", base.timeout_s)),
+		force_range_n=float(data.get("force_range_n", data.get("range_n", base.force_range_n))),
+		counts_full_scale=float(data.get("counts_full_scale", base.counts_full_scale)),
+		poll_interval_ms=poll_interval_ms,
+		language=language,
+	)
+	_LOAD_CACHE[path] = (st.st_mtime_ns, _cache_copy(cfg))
 	return cfg
 
 
 def save_config(cfg: AppConfig, path: Path = CONFIG_PATH) -> None:
-	path.write_text(json.dumps(cfg.to_file_dict(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+	# Stream into a buffered temp file, then atomically replace the target so a
+	# crash mid-write never leaves a truncated config behind.
+	tmp = path.with_suffix(path.suffix + ".tmp")
+	with open(tmp, "w", encoding="utf-8", buffering=65536) as f:
+		json.dump(cfg.to_file_dict(), f, ensure_ascii=False, indent=2, separators=(",", ": "))
+		f.write("\n")
+		f.flush()
+		os.fsync(f.fileno())
+	os.replace(tmp, path)
 
 
 def apply_updates(cfg: AppConfig, updates: Dict[str, Any]) -> AppConfig:
-	base = {k: v for k, v in cfg.to_file_dict().items() if k != "n_per_count"}
-	new_cfg = AppConfig(**base)
+	changes: Dict[str, Any] = {}
 	if "sensor_ip" in updates:
-		new_cfg.sensor_ip = str(updates["sensor_ip"])
+		changes["sensor_ip"] = str(updates["sensor_ip"])
 	if "sensor_port" in updates:
-		new_cfg.sensor_port = int(updates["sensor_port"])
+		changes["sensor_port"] = int(updates["sensor_port"])
 	if "axis_device_ids" in updates:
-		new_cfg.axis_device_ids = _coerce_int_list(updates["axis_device_ids"], default=new_cfg.axis_device_ids)
+		changes["axis_device_ids"] = _coerce_int_list(updates["axis_device_ids"], default=cfg.axis_device_ids)
 	if "force_range_n" in updates:
-		new_cfg.force_range_n = float(updates["force_range_n"])
+		changes["force_range_n"] = float(updates["force_range_n"])
 	if "poll_hz" in updates:
 		hz = float(updates["poll_hz"])
 		if hz <= 0:
 			raise ValueError("poll_hz must be > 0")
-		new_cfg.poll_interval_ms = int(round(1000.0 / hz))
+		changes["poll_interval_ms"] = int(round(1000.0 / hz))
 	elif "poll_interval_ms" in updates:
-		new_cfg.poll_interval_ms = int(updates["poll_interval_ms"])
+		changes["poll_interval_ms"] = int(updates["poll_interval_ms"])
 	if "language" in updates:
 		lang = str(updates["language"])
-		new_cfg.language = lang if lang in ("zh", "en") else new_cfg.language
+		if lang in ("zh", "en"):
+			changes["language"] = lang
+	new_cfg = replace(cfg, **changes)
 
 	if new_cfg.sensor_port <= 0 or new_cfg.sensor_port > 65535:
 		raise ValueError("sensor_port out of range")
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 import sys
+import textwrap
 import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
-import pyqtgraph as pg
+import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from arizon_config import AppConfig, apply_updates, load_config, save_config
-from six_axis_force_sensor import SixAxisForceSensor
 
+if TYPE_CHECKING:  # imported lazily at runtime to keep startup fast
+	from six_axis_force_sensor import SixAxisForceSensor
 
-@dataclass
+_AXIS_WS_TABLE = str.maketrans("", "", " \t\r\n")
+
+
+@dataclass(frozen=True, slots=True)
 class UiText:
 	monitor: str
 	settings: str
@@ -93,8 +98,117 @@ I18N = {
 }
 
 
+_STYLESHEET = textwrap.dedent(
+	"""
+	QMainWindow { background: #eef4f7; }
+	#sidebar {
+	  background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #2aa9b3, stop:1 #88e6c5);
+	}
+	#brandMark {
+	  border-radius: 14px;
+	  background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 rgba(255,255,255,90), stop:1 rgba(255,255,255,30));
+	  border: 1px solid rgba(255,255,255,90);
+	}
+	#brandTitle { color: rgba(255,255,255,235); font-weight: 900; letter-spacing: 2px; }
+	#brandSub { color: rgba(255,255,255,180); font-size: 12px; }
+	#navBtn {
+	  text-align: left;
+	  padding: 12px 12px;
+	  border-radius: 14px;
+	  border: 1px solid rgba(255,255,255,40);
+	  background: rgba(255,255,255,36);
+	  color: rgba(255,255,255,235);
+	  font-weight: 800;
+	}
+	#navBtn:checked { background: rgba(255,255,255,66); }
+	#panelCard {
+	  border-radius: 20px;
+	  background: rgba(255,255,255,210);
+	  border: 1px solid rgba(255,255,255,170);
+	}
+	#panelTitle { font-weight: 900; }
+	#panelMeta { color: rgba(15,23,42,150); }
+	#panelFooter { color: #64748b; font-size: 12px; }
+	#valueRow {
+	  border-radius: 16px;
+	  background: rgba(15,23,42,8);
+	  border: 1px solid rgba(15,23,42,10);
+	}
+	#axis_fx { color: #f59e0b; font-weight: 900; }
+	#axis_fy { color: #22c55e; font-weight: 900; }
+	#axis_fz { color: #8b5cf6; font-weight: 900; }
+	#valueBig { font-size: 26px; font-weight: 900; color: #0f172a; }
+	#unit { color: #64748b; font-weight: 800; }
+	#btnPrimary {
+	  padding: 12px 12px;
+	  border-radius: 14px;
+	  background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #1b8bb7, stop:1 #1fd0c7);
+	  color: white;
+	  font-weight: 900;
+	  border: 0;
+	}
+	#btnGhost {
+	  padding: 12px 12px;
+	  border-radius: 14px;
+	  background: rgba(255,255,255,210);
+	  color: #0f172a;
+	  font-weight: 900;
+	  border: 1px solid rgba(15,23,42,20);
+	}
+	#hTitle { font-size: 18px; font-weight: 900; color: #0f172a; }
+	#hSub { font-size: 12px; color: #64748b; }
+	#chip {
+	  border-radius: 999px;
+	  background: rgba(255,255,255,160);
+	  border: 1px solid rgba(15,23,42,20);
+	}
+	#dot { border-radius: 5px; background: #fbbf24; }
+	#chipText { color: #0f172a; font-weight: 800; }
+	#plotCard {
+	  border-radius: 20px;
+	  background: rgba(255,255,255,200);
+	  border: 1px solid rgba(15,23,42,20);
+	}
+	#footer {
+	  border-radius: 16px;
+	  background: rgba(255,255,255,150);
+	  border: 1px solid rgba(15,23,42,18);
+	}
+	#muted { color: #64748b; font-weight: 800; }
+	#footerVal { color: #0f172a; font-weight: 800; }
+	QLineEdit, QSpinBox, QDoubleSpinBox {
+	  border-radius: 14px;
+	  border: 1px solid rgba(15,23,42,20);
+	  padding: 10px 10px;
+	  background: rgba(255,255,255,220);
+	}
+	#fieldLabel { color: #64748b; font-weight: 900; font-size: 12px; }
+	#segWrap {
+	  border-radius: 14px;
+	  background: rgba(15,23,42,8);
+	  border: 1px solid rgba(15,23,42,12);
+	}
+	#segBtn {
+	  border-radius: 10px;
+	  padding: 10px 10px;
+	  font-weight: 900;
+	  border: 0;
+	  background: transparent;
+	  color: rgba(15,23,42,180);
+	}
+	#segBtn:checked {
+	  background: rgba(255,255,255,230);
+	  color: rgba(15,23,42,235);
+	}
+	"""
+)
+
+
+_ZERO_FT = bytes(24)  # six float32 zeros
+
+
 class SensorController(QtCore.QObject):
-	updated = QtCore.Signal(tuple, str, bool)  # ft6, message, connected
+	updated = QtCore.Signal(bytes, str, bool)  # ft6 as packed float32, message, connected
 	bias_updated = QtCore.Signal(tuple)  # bias6
 
 	def __init__(self, cfg: AppConfig) -> None:
@@ -103,8 +217,15 @@ class SensorController(QtCore.QObject):
 		self.sensor = self._build_sensor(cfg)
 		self.connected = False
 		self.last_error = ""
+		# Reused per poll; emitted as an immutable bytes snapshot so queued
+		# cross-thread delivery can never observe a half-written sample.
+		self._ft_buf = np.zeros(6, dtype=np.float32)
 
 	def _build_sensor(self, cfg: AppConfig) -> SixAxisForceSensor:
+		# Deferred so importing this module (and showing the window) doesn't
+		# pay for pymodbus up front.
+		from six_axis_force_sensor import SixAxisForceSensor
+
 		return SixAxisForceSensor(
 			cfg.sensor_ip,
 			port=cfg.sensor_port,
@@ -114,6 +235,7 @@ class SensorController(QtCore.QObject):
 			n_per_count=cfg.n_per_count(),
 		)
 
+	@QtCore.Slot(object)
 	def reconfigure(self, cfg: AppConfig) -> None:
 		try:
 			self.sensor.close()
@@ -142,14 +264,15 @@ class SensorController(QtCore.QObject):
 		try:
 			if not self._ensure_connected():
 				raise RuntimeError(self.last_error or "not connected")
-			ft = self.sensor.get_force_torque(unbiased=False)
+			self._ft_buf[:] = self.sensor.get_force_torque(unbiased=False)
 			self.last_error = "Modbus OK"
-			self.updated.emit(ft, self.last_error, True)
+			self.updated.emit(self._ft_buf.tobytes(), self.last_error, True)
 		except Exception as e:
 			self.connected = False
 			self.last_error = str(e)
-			self.updated.emit((0.0, 0.0, 0.0, 0.0, 0.0, 0.0), self.last_error, False)
+			self.updated.emit(_ZERO_FT, self.last_error, False)
 
+	@QtCore.Slot(int)
 	def tare(self, samples: int = 30) -> None:
 		try:
 			if not self._ensure_connected():
@@ -160,12 +283,18 @@ class SensorController(QtCore.QObject):
 			self.connected = False
 			self.last_error = str(e)
 
+	@QtCore.Slot()
 	def clear(self) -> None:
 		self.sensor.unbias()
 		self.bias_updated.emit((0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
 
 
 class MainWindow(QtWidgets.QMainWindow):
+	# UI-thread requests to the controller; queued across the thread boundary.
+	request_tare = QtCore.Signal(int)
+	request_clear = QtCore.Signal()
+	request_reconfigure = QtCore.Signal(object)
+
 	def __init__(self) -> None:
 		super().__init__()
 		self.cfg = load_config()
@@ -175,27 +304,76 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.setWindowTitle(self.t.title)
 		self.setMinimumSize(1100, 680)
 
+		# The controller lives on a worker thread so a blocking Modbus read
+		# (up to timeout_s) can never stall the Qt event loop.
 		self.controller = SensorController(self.cfg)
 		self.controller.updated.connect(self.on_sensor_update)
 		self.controller.bias_updated.connect(self.on_bias_update)
+		self._worker = QtCore.QThread(self)
+		self.controller.moveToThread(self._worker)
+		self.request_tare.connect(self.controller.tare)
+		self.request_clear.connect(self.controller.clear)
+		self.request_reconfigure.connect(self.controller.reconfigure)
 
 		self.recording = False
 		self.record_start_time = 0.0
 		self.record_data: List[Tuple[float, float, float, float]] = []
 
+		# Precompiled value format plus last-set strings, so stable readings
+		# skip the QLabel.setText/layout work entirely.
+		self._fmt = "{:+.2f}".format
+		self._last_fx = self._last_fy = self._last_fz = ""
+
+		# Connection chip styles are fixed; only reassign on an actual flip.
+		self._DOT_OK = "background:#22c55e;border-radius:5px;"
+		self._DOT_ERR = "background:#ef4444;border-radius:5px;"
+		self._last_ok: bool | None = None
+
 		self._build_ui()
 		self._apply_styles()
+		# Precomputed (setter, UiText field) pairs so _apply_text is one loop.
+		self._text_bindings = (
+			(self.btnMonitor.setText, "monitor"),
+			(self.btnSettings.setText, "settings"),
+			(self.hTitle.setText, "title"),
+			(self.hSub.setText, "subtitle"),
+			(self.btnTare.setText, "tare"),
+			(self.btnClear.setText, "clear"),
+			(self.btnRecordStart.setText, "start_record"),
+			(self.btnRecordStop.setText, "stop_record"),
+			(self.btnSave.setText, "save"),
+			(self.lblIp.setText, "labels_sensor_ip"),
+			(self.lblPort.setText, "labels_port"),
+			(self.lblAxis.setText, "labels_axis_ids"),
+			(self.lblRange.setText, "labels_force_range"),
+			(self.lblLang.setText, "labels_language"),
+		)
 		self._apply_text()
 		self._init_plot()
 
-		self.poll_timer = QtCore.QTimer(self)
+		# Unparented so it can live on the worker thread alongside the controller.
+		self.poll_timer = QtCore.QTimer()
 		self.poll_timer.setInterval(self.cfg.poll_interval_ms)
+		self.poll_timer.moveToThread(self._worker)
 		self.poll_timer.timeout.connect(self.controller.poll)
-		self.poll_timer.start()
-
-		self.controller.poll()
+		self._worker.started.connect(self.poll_timer.start)
+		self._worker.start()
+		self._update_hz_label()
+
+		# Render at ~30 Hz regardless of the poll rate; polls only fill the ring buffer.
+		self._dirty = False
+		self.render_timer = QtCore.QTimer(self)
+		self.render_timer.setInterval(33)
+		self.render_timer.timeout.connect(self._redraw_curves)
+		self.render_timer.start()
+
+		QtCore.QMetaObject.invokeMethod(
+			self.controller, "poll", QtCore.Qt.ConnectionType.QueuedConnection
+		)
 
 	def _build_ui(self) -> None:
+		import pyqtgraph as pg
+
 		root = QtWidgets.QWidget()
 		self.setCentralWidget(root)
 		layout = QtWidgets.QHBoxLayout(root)
@@ -228,10 +406,18 @@ class MainWindow(QtWidgets.QMainWindow):
 		brand.addStretch(1)
 		side.addLayout(brand)
 
+		# Checkable buttons in an exclusive group: active state is pure QSS
+		# (:checked), no objectName swap or unpolish/polish re-resolution.
 		self.btnMonitor = QtWidgets.QPushButton()
-		self.btnMonitor.setObjectName("navBtnActive")
+		self.btnMonitor.setObjectName("navBtn")
+		self.btnMonitor.setCheckable(True)
 		self.btnSettings = QtWidgets.QPushButton()
 		self.btnSettings.setObjectName("navBtn")
+		self.btnSettings.setCheckable(True)
+		self.navGroup = QtWidgets.QButtonGroup(self)
+		self.navGroup.setExclusive(True)
+		self.navGroup.addButton(self.btnMonitor)
+		self.navGroup.addButton(self.btnSettings)
 		self.btnMonitor.clicked.connect(lambda: self.set_view("monitor"))
 		self.btnSettings.clicked.connect(lambda: self.set_view("settings"))
 		side.addWidget(self.btnMonitor)
@@ -269,12 +455,12 @@ class MainWindow(QtWidgets.QMainWindow):
 		ml.setContentsMargins(16, 16, 16, 16)
 		ml.setSpacing(12)
 
-		self.fxVal = self._make_value_row("Fx")
-		self.fyVal = self._make_value_row("Fy")
-		self.fzVal = self._make_value_row("Fz")
-		ml.addWidget(self.fxVal["row"])
-		ml.addWidget(self.fyVal["row"])
-		ml.addWidget(self.fzVal["row"])
+		row, self.fxVal = self._make_value_row("Fx")
+		ml.addWidget(row)
+		row, self.fyVal = self._make_value_row("Fy")
+		ml.addWidget(row)
+		row, self.fzVal = self._make_value_row("Fz")
+		ml.addWidget(row)
 
 		actions = QtWidgets.QHBoxLayout()
 		actions.setSpacing(10)
@@ -282,8 +468,8 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.btnTare.setObjectName("btnPrimary")
 		self.btnClear = QtWidgets.QPushButton()
 		self.btnClear.setObjectName("btnGhost")
-		self.btnTare.clicked.connect(lambda: self.controller.tare(samples=30))
-		self.btnClear.clicked.connect(self.controller.clear)
+		self.btnTare.clicked.connect(lambda: self.request_tare.emit(30))
+		self.btnClear.clicked.connect(self.request_clear.emit)
 		actions.addWidget(self.btnTare)
 		actions.addWidget(self.btnClear)
 		self.btnRecordStart = QtWidgets.QPushButton()
@@ -314,10 +500,26 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.inHz = QtWidgets.QLineEdit()
 		self.inHz.setValidator(QtGui.QDoubleValidator(0.1, 1000.0, 2, self))
 
+		# (update key, widget, converter) — validators already guarantee the
+		# numeric fields are well-formed, so converters run on raw text.
+		self._save_schema = (
+			("sensor_ip", self.inIp, str),
+			("sensor_port", self.inPort, int),
+			("axis_device_ids", self.inAxis, self._parse_axis_ids),
+			("force_range_n", self.inRange, float),
+			("poll_hz", self.inHz, float),
+		)
+
 		self.langZh = QtWidgets.QPushButton("中文")
 		self.langEn = QtWidgets.QPushButton("English")
 		self.langZh.setObjectName("segBtn")
 		self.langEn.setObjectName("segBtn")
+		self.langZh.setCheckable(True)
+		self.langEn.setCheckable(True)
+		self.langGroup = QtWidgets.QButtonGroup(self)
+		self.langGroup.setExclusive(True)
+		self.langGroup.addButton(self.langZh)
+		self.langGroup.addButton(self.langEn)
 		self.langZh.clicked.connect(lambda: self.set_language("zh"))
 		self.langEn.clicked.connect(lambda: self.set_language("en"))
 
@@ -443,7 +645,7 @@ class MainWindow(QtWidgets.QMainWindow):
 		self._load_cfg_to_form()
 		self.set_view("monitor")
 
-	def _make_value_row(self, axis: str) -> dict:
+	def _make_value_row(self, axis: str) -> Tuple[QtWidgets.QFrame, QtWidgets.QLabel]:
 		row = QtWidgets.QFrame()
 		row.setObjectName("valueRow")
 		hl = QtWidgets.QHBoxLayout(row)
@@ -459,7 +661,7 @@ class MainWindow(QtWidgets.QMainWindow):
 		hl.addStretch(1)
 		hl.addWidget(val)
 		hl.addWidget(unit)
-		return {"row": row, "val": val}
+		return row, val
 
 	def _field(self, label: QtWidgets.QLabel, widget: QtWidgets.QWidget) -> QtWidgets.QHBoxLayout:
 		box = QtWidgets.QVBoxLayout()
@@ -469,144 +671,34 @@ class MainWindow(QtWidgets.QMainWindow):
 		return box
 
 	def _apply_styles(self) -> None:
-		self.setStyleSheet(
-			"""
-			QMainWindow { background: #eef4f7; }
-			#sidebar {
-			  background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #2aa9b3, stop:1 #88e6c5);
-			}
-			#brandMark {
-			  border-radius: 14px;
-			  background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 rgba(255,255,255,90), stop:1 rgba(255,255,255,30));
-			  border: 1px solid rgba(255,255,255,90);
-			}
-			#brandTitle { color: rgba(255,255,255,235); font-weight: 900; letter-spacing: 2px; }
-			#brandSub { color: rgba(255,255,255,180); font-size: 12px; }
-			#navBtn, #navBtnActive {
-			  text-align: left;
-			  padding: 12px 12px;
-			  border-radius: 14px;
-			  border: 1px solid rgba(255,255,255,40);
-			  background: rgba(255,255,255,36);
-			  color: rgba(255,255,255,235);
-			  font-weight: 800;
-			}
-			#navBtnActive { background: rgba(255,255,255,66); }
-			#panelCard {
-			  border-radius: 20px;
-			  background: rgba(255,255,255,210);
-			  border: 1px solid rgba(255,255,255,170);
-			}
-			#panelTitle { font-weight: 900; }
-			#panelMeta { color: rgba(15,23,42,150); }
-			#panelFooter { color: #64748b; font-size: 12px; }
-			#valueRow {
-			  border-radius: 16px;
-			  background: rgba(15,23,42,8);
-			  border: 1px solid rgba(15,23,42,10);
-			}
-			#axis_fx { color: #f59e0b; font-weight: 900; }
-			#axis_fy { color: #22c55e; font-weight: 900; }
-			#axis_fz { color: #8b5cf6; font-weight: 900; }
-			#valueBig { font-size: 26px; font-weight: 900; color: #0f172a; }
-			#unit { color: #64748b; font-weight: 800; }
-			#btnPrimary {
-			  padding: 12px 12px;
-			  border-radius: 14px;
-			  background: qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #1b8bb7, stop:1 #1fd0c7);
-			  color: white;
-			  font-weight: 900;
-			  border: 0;
-			}
-			#btnGhost {
-			  padding: 12px 12px;
-			  border-radius: 14px;
-			  background: rgba(255,255,255,210);
-			  color: #0f172a;
-			  font-weight: 900;
-			  border: 1px solid rgba(15,23,42,20);
-			}
-			#hTitle { font-size: 18px; font-weight: 900; color: #0f172a; }
-			#hSub { font-size: 12px; color: #64748b; }
-			#chip {
-			  border-radius: 999px;
-			  background: rgba(255,255,255,160);
-			  border: 1px solid rgba(15,23,42,20);
-			}
-			#dot { border-radius: 5px; background: #fbbf24; }
-			#chipText { color: #0f172a; font-weight: 800; }
-			#plotCard {
-			  border-radius: 20px;
-			  background: rgba(255,255,255,200);
-			  border: 1px solid rgba(15,23,42,20);
-			}
-			#footer {
-			  border-radius: 16px;
-			  background: rgba(255,255,255,150);
-			  border: 1px solid rgba(15,23,42,18);
-			}
-			#muted { color: #64748b; font-weight: 800; }
-			#footerVal { color: #0f172a; font-weight: 800; }
-			QLineEdit, QSpinBox, QDoubleSpinBox {
-			  border-radius: 14px;
-			  border: 1px solid rgba(15,23,42,20);
-			  padding: 10px 10px;
-			  background: rgba(255,255,255,220);
-			}
-			#fieldLabel { color: #64748b; font-weight: 900; font-size: 12px; }
-			#segWrap {
-			  border-radius: 14px;
-			  background: rgba(15,23,42,8);
-			  border: 1px solid rgba(15,23,42,12);
-			}
-			#segBtn {
-			  border-radius: 10px;
-			  padding: 10px 10px;
-			  font-weight: 900;
-			  border: 0;
-			  background: transparent;
-			  color: rgba(15,23,42,180);
-			}
-			#segBtn[active="true"] {
-			  background: rgba(255,255,255,230);
-			  color: rgba(15,23,42,235);
-			}
-			"""
-		)
+		self.setStyleSheet(_STYLESHEET)
 
 	def _apply_text(self) -> None:
-		self.t = I18N[self.lang]
-		self.setWindowTitle(self.t.title)
+		t = self.t = I18N[self.lang]
+		self.setWindowTitle(t.title)
+		for setter, name in self._text_bindings:
+			setter(getattr(t, name))
 		self.brandSub.setText("力传感器" if self.lang == "zh" else "Force Sensor")
-		self.btnMonitor.setText(self.t.monitor)
-		self.btnSettings.setText(self.t.settings)
-		self.hTitle.setText(self.t.title)
-		self.hSub.setText(self.t.subtitle)
 		self.plotTitle.setText("实时曲线区" if self.lang == "zh" else "Realtime Plot")
-		self.statusLabel.setText(f"{self.t.status}:")
-		self.ipLabel.setText(f"{self.t.ip}:")
-		self.btnTare.setText(self.t.tare)
-		self.btnClear.setText(self.t.clear)
-		self.btnRecordStart.setText(self.t.start_record)
-		self.btnRecordStop.setText(self.t.stop_record)
-		self.btnSave.setText(self.t.save)
-		self.lblIp.setText(self.t.labels_sensor_ip)
-		self.lblPort.setText(self.t.labels_port)
-		self.lblAxis.setText(self.t.labels_axis_ids)
-		self.lblRange.setText(self.t.labels_force_range)
+		self.statusLabel.setText(f"{t.status}:")
+		self.ipLabel.setText(f"{t.ip}:")
 		self.lblHz.setText("采样频率 (Hz)" if self.lang == "zh" else "Sample Rate (Hz)")
-		self.lblLang.setText(self.t.labels_language)
 
 	def _init_plot(self) -> None:
+		import pyqtgraph as pg
+
 		self.history = 360
-		self.x = list(range(self.history))
-		self.y_fx: List[float] = [0.0] * self.history
-		self.y_fy: List[float] = [0.0] * self.history
-		self.y_fz: List[float] = [0.0] * self.history
-
-		self.curve_fx = self.plotWidget.plot(self.x, self.y_fx, pen=pg.mkPen("#f59e0b", width=2))
-		self.curve_fy = self.plotWidget.plot(self.x, self.y_fy, pen=pg.mkPen("#22c55e", width=2))
-		self.curve_fz = self.plotWidget.plot(self.x, self.y_fz, pen=pg.mkPen("#8b5cf6", width=2))
+		self.x = np.arange(self.history, dtype=np.float32)
+		# Ring buffer: one row per axis, written in place each poll.
+		self.y = np.zeros((3, self.history), dtype=np.float32)
+		self._view = np.zeros((3, self.history), dtype=np.float32)
+		self._head = 0
+
+		# skipFiniteCheck: the ring buffer never holds NaN/inf, so let
+		# pyqtgraph skip the per-point isfinite scan on every redraw.
+		self.curve_fx = self.plotWidget.plot(self.x, self._view[0], pen=pg.mkPen("#f59e0b", width=2), skipFiniteCheck=True)
+		self.curve_fy = self.plotWidget.plot(self.x, self._view[1], pen=pg.mkPen("#22c55e", width=2), skipFiniteCheck=True)
+		self.curve_fz = self.plotWidget.plot(self.x, self._view[2], pen=pg.mkPen("#8b5cf6", width=2), skipFiniteCheck=True)
 		self._apply_plot_range()
 
 	def _apply_plot_range(self) -> None:
@@ -624,84 +716,104 @@ class MainWindow(QtWidgets.QMainWindow):
 		self.ipVal.setText(self.cfg.sensor_ip)
 
 	def _apply_lang_buttons(self) -> None:
-		self.langZh.setProperty("active", "true" if self.lang == "zh" else "false")
-		self.langEn.setProperty("active", "true" if self.lang == "en" else "false")
-		self.langZh.style().unpolish(self.langZh)
-		self.langZh.style().polish(self.langZh)
-		self.langEn.style().unpolish(self.langEn)
-		self.langEn.style().polish(self.langEn)
+		self.langZh.setChecked(self.lang == "zh")
+		self.langEn.setChecked(self.lang == "en")
 
 	def set_language(self, lang: str) -> None:
 		self.lang = "en" if lang == "en" else "zh"
 		self._apply_text()
 		self._apply_lang_buttons()
 		self.cfg.language = self.lang
+		self._last_ok = None  # force the chip text to refresh in the new language
 
 	def set_view(self, view: str) -> None:
 		is_monitor = view == "monitor"
-		self.btnMonitor.setObjectName("navBtnActive" if is_monitor else "navBtn")
-		self.btnSettings.setObjectName("navBtnActive" if not is_monitor else "navBtn")
-		self.btnMonitor.style().unpolish(self.btnMonitor)
-		self.btnMonitor.style().polish(self.btnMonitor)
-		self.btnSettings.style().unpolish(self.btnSettings)
-		self.btnSettings.style().polish(self.btnSettings)
+		self.btnMonitor.setChecked(is_monitor)
+		self.btnSettings.setChecked(not is_monitor)
 		self.panelStack.setCurrentIndex(0 if is_monitor else 1)
 		self.panelTitle.setText(self.t.panel_monitor if is_monitor else self.t.panel_settings)
 		self.panelMeta.setVisible(is_monitor)
 		self.panelFooter.setText(f"{self.t.bias}: 0, 0, 0" if is_monitor else "—")
 
 	def _parse_axis_ids(self, text: str) -> List[int]:
-		parts = [p.strip() for p in text.split(",") if p.strip()]
-		return [int(p) for p in parts]
+		cleaned = text.translate(_AXIS_WS_TABLE)
+		return [int(p) for p in cleaned.split(",") if p]
 
 	def on_save(self) -> None:
-		port = int(self.inPort.text() or "502")
-		range_n = float(self.inRange.text() or "20")
-		hz = float(self.inHz.text() or "20")
-		updates = {
-			"sensor_ip": self.inIp.text().strip(),
-			"sensor_port": port,
-			"axis_device_ids": self._parse_axis_ids(self.inAxis.text()),
-			"force_range_n": range_n,
-			"poll_hz": hz,
-			"language": self.lang,
-		}
+		updates = {"language": self.lang}
+		for key, widget, conv in self._save_schema:
+			text = widget.text().strip()
+			if not text:
+				continue  # empty field keeps the current value
+			updates[key] = conv(text)
 		try:
-			new_cfg = apply_updates(load_config(), updates)
+			# self.cfg is the authoritative in-memory state; no need to re-read
+			# config.json just to apply a delta on top of it.
+			new_cfg = apply_updates(self.cfg, updates)
 			save_config(new_cfg)
 			self.cfg = new_cfg
-			self.controller.reconfigure(new_cfg)
-			self.poll_timer.setInterval(self.cfg.poll_interval_ms)
+			self.request_reconfigure.emit(new_cfg)
+			# start(int) both sets the interval and restarts, and is a slot we
+			# can queue into the timer's (worker) thread.
+			QtCore.QMetaObject.invokeMethod(
+				self.poll_timer,
+				"start",
+				QtCore.Qt.ConnectionType.QueuedConnection,
+				QtCore.Q_ARG(int, self.cfg.poll_interval_ms),
+			)
+			self._update_hz_label()
 			self._apply_plot_range()
 			self._load_cfg_to_form()
 			self.statusVal.setText("已保存" if self.lang == "zh" else "Saved")
 		except Exception as e:
 			self.statusVal.setText(str(e))
 
-	def on_sensor_update(self, ft: Tuple[float, float, float, float, float, float], msg: str, ok: bool) -> None:
-		fx, fy, fz, *_ = ft
-		self.fxVal["val"].setText(f"{fx:+.2f}")
-		self.fyVal["val"].setText(f"{fy:+.2f}")
-		self.fzVal["val"].setText(f"{fz:+.2f}")
+	def on_sensor_update(self, ft_bytes: bytes, msg: str, ok: bool) -> None:
+		ft = np.frombuffer(ft_bytes, dtype=np.float32)
+		fx, fy, fz = float(ft[0]), float(ft[1]), float(ft[2])
+		s = self._fmt(fx)
+		if s != self._last_fx:
+			self.fxVal.setText(s)
+			self._last_fx = s
+		s = self._fmt(fy)
+		if s != self._last_fy:
+			self.fyVal.setText(s)
+			self._last_fy = s
+		s = self._fmt(fz)
+		if s != self._last_fz:
+			self.fzVal.setText(s)
+			self._last_fz = s
 
 		if self.recording:
 			t_rel = time.monotonic() - self.record_start_time
 			self.record_data.append((t_rel, fx, fy, fz))
 
-		self.y_fx = self.y_fx[1:] + [fx]
-		self.y_fy = self.y_fy[1:] + [fy]
-		self.y_fz = self.y_fz[1:] + [fz]
-		self.curve_fx.setData(self.x, self.y_fx)
-		self.curve_fy.setData(self.x, self.y_fy)
-		self.curve_fz.setData(self.x, self.y_fz)
+		self.y[:, self._head] = (fx, fy, fz)
+		self._head = (self._head + 1) % self.history
+		self._dirty = True
 
 		self.statusVal.setText(msg)
 		self.ipVal.setText(self.cfg.sensor_ip)
-		self.connText.setText(self.t.connected if ok else self.t.disconnected)
-		self.connDot.setStyleSheet(f"background: {'#22c55e' if ok else '#ef4444'}; border-radius: 5px;")
+		if ok != self._last_ok:
+			self.connText.setText(self.t.connected if ok else self.t.disconnected)
+			self.connDot.setStyleSheet(self._DOT_OK if ok else self._DOT_ERR)
+			self._last_ok = ok
 
-		# Rough Hz from timer interval
-		hz = 1000.0 / max(1, self.poll_timer.interval())
+	def _redraw_curves(self) -> None:
+		if not self._dirty:
+			return
+		self._dirty = False
+		# Unroll the ring into the scratch view (two slice copies, no allocation).
+		tail = self.history - self._head
+		self._view[:, :tail] = self.y[:, self._head:]
+		self._view[:, tail:] = self.y[:, :self._head]
+		self.curve_fx.setData(self.x, self._view[0], skipFiniteCheck=True)
+		self.curve_fy.setData(self.x, self._view[1], skipFiniteCheck=True)
+		self.curve_fz.setData(self.x, self._view[2], skipFiniteCheck=True)
+
+	def _update_hz_label(self) -> None:
+		# Rough Hz from the configured interval; only changes on Save.
+		hz = 1000.0 / max(1, self.cfg.poll_interval_ms)
 		self.panelMeta.setText(f"{hz:.1f} Hz")
 
 	def on_bias_update(self, bias6: Tuple[float, float, float, float, float, float]) -> None:
@@ -709,6 +821,16 @@ class MainWindow(QtWidgets.QMainWindow):
 		if self.panelStack.currentIndex() == 0:
 			self.panelFooter.setText(f"{self.t.bias}: {fx:.3f}, {fy:.3f}, {fz:.3f}")
 
+	def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+		# Blocking, not queued: quit() would exit the worker loop before a
+		# queued stop ran, leaving a live timer to be destroyed cross-thread.
+		QtCore.QMetaObject.invokeMethod(
+			self.poll_timer, "stop", QtCore.Qt.ConnectionType.BlockingQueuedConnection
+		)
+		self._worker.quit()
+		self._worker.wait(2000)
+		super().closeEvent(event)
+
 	def start_record(self) -> None:
 		self.recording = True
 		self.record_start_time = time.monotonic()
@@ -741,8 +863,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
 def main() -> int:
+	import pyqtgraph as pg
+
 	app = QtWidgets.QApplication(sys.argv)
-	pg.setConfigOptions(antialias=True)
+	pg.setConfigOptions(antialias=False, useOpenGL=True)
 	w = MainWindow()
 	w.show()
 	return app.exec()
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import socket
+import struct
+import threading
 import time
 from dataclasses import dataclass
 from typing import Optional, Sequence, Tuple, Union
 
+import numpy as np
 from pymodbus.client import ModbusTcpClient
 
 
-def _u16_to_s16(value: int) -> int:
-	value &= 0xFFFF
-	return value - 0x10000 if value & 0x8000 else value
+# 三轴是最常见情况，Struct 预编译好；其它长度走通用路径。
+_PACK3 = struct.Struct(">3H")
+_UNPACK3 = struct.Struct(">3h")
+
+
+def _u16s_to_s16s(values: Sequence[int]) -> Tuple[int, ...]:
+	# 一次 C 级 pack/unpack 完成全部符号转换，没有逐元素的 Python 分支。
+	if len(values) == 3:
+		return _UNPACK3.unpack(_PACK3.pack(*values))
+	n = len(values)
+	return struct.unpack(f">{n}h", struct.pack(f">{n}H", *values))
 
 
 @dataclass(frozen=True)
@@ -52,6 +65,8 @@ class SixAxisForceSensor:
 		n_per_count: Optional[float] = None,
 		force_range_n: float = DEFAULT_FORCE_RANGE_N,
 		counts_full_scale: float = DEFAULT_COUNTS_FULL_SCALE,
+		single_unit_mode: bool = False,
+		use_fast_transport: bool = False,
 	) -> None:
 		self.ip = ip
 		self.port = port
@@ -71,8 +86,63 @@ class SixAxisForceSensor:
 				raise ValueError("address sequence length must match axis_device_ids length")
 			self.addresses = addresses
 
+		# When every axis sits behind the same device id and the registers are
+		# close together, one block read replaces three TCP round-trips.
+		# single_unit_mode 强制走这条路（把第一个 id 当作公共 unit id），
+		# 用于 id 列表写得不一致但硬件实际是单 unit 的情况。
+		self.single_unit_mode = bool(single_unit_mode)
+		self._batch_plan: Optional[Tuple[int, int, int, Tuple[int, ...]]] = None
+		if self.axis_device_ids and (self.single_unit_mode or len(set(self.axis_device_ids)) == 1):
+			start = min(self.addresses)
+			count = max(self.addresses) - start + 1
+			if self.single_unit_mode:
+				if count > 125:
+					# Modbus 单次读上限 125 个寄存器
+					raise ValueError("register span too large for a single Modbus read (max 125)")
+			elif count > 16:
+				count = 0  # 自动检测只合并小窗口，太散就回退逐轴读
+			if count:
+				offsets = tuple(a - start for a in self.addresses)
+				self._batch_plan = (self.axis_device_ids[0], start, count, offsets)
+
+		# 主机名只解析一次；重连循环里不再触发可能阻塞的 DNS 查询。
+		try:
+			self._addrinfo = socket.getaddrinfo(ip, port, socket.AF_INET, socket.SOCK_STREAM)[0]
+			self._resolved_ip: str = self._addrinfo[4][0]
+		except OSError:
+			self._addrinfo = None
+			self._resolved_ip = ip
+
 		self._client = self._create_client()
 		self._bias = Wrench(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+		# 换算用的标量/向量都预先放进 numpy，热路径上一次乘加搞定。
+		self._scale = np.float32(self._n_per_count)
+		self._bias_arr = np.zeros(6, dtype=np.float32)
+		# 热路径复用的输出缓冲；只有显式要 Wrench 的调用才构造 dataclass。
+		self._wrench_buf = np.zeros(6, dtype=np.float32)
+		# raw u16 -> 力(N) 查表（64K x float32 = 256 KiB），首次读取时才建。
+		self._lut: Optional[np.ndarray] = None
+		# 原始寄存器/counts 也各用一块复用缓冲，采样路径零分配。
+		n_axes = len(self.axis_device_ids)
+		self._raw_buf = np.empty(n_axes, dtype=np.int32)
+		self._counts_buf = np.empty(n_axes, dtype=np.int32)
+		# 偏置的权威存储是 int16 counts（量程本来就在 ±32768 counts 内）；
+		# _bias_arr/_bias 只是按当前标定换算出来的缓存。
+		self._bias_counts = np.zeros(n_axes, dtype=np.int16)
+		# (device_id, address) 对也冻结下来，逐轴路径不用每次重建 zip 迭代器。
+		self._axis_plan = tuple(zip(self.axis_device_ids, self.addresses))
+		# 第一次探测出可用的 read_holding_registers 签名后缓存起来，
+		# 热路径不再每次都从头试 5 种变体。
+		self._read_call = None
+		# 可选：绕过 pymodbus 的事务层，直接用 _fastmodbus 的 raw-socket
+		# MBAP+FC3 实现（connect 时建立，失败回退 pymodbus）。
+		self.use_fast_transport = bool(use_fast_transport)
+		self._fast = None
+		# 后台采样线程（单生产者单消费者）：最新 wrench 放在单槽缓冲里。
+		self._stream_thread: Optional[threading.Thread] = None
+		self._stream_run = False
+		self._latest = np.zeros(6, dtype=np.float32)
+		self._latest_lock = threading.Lock()
 
 	@property
 	def n_per_count(self) -> float:
@@ -84,9 +154,12 @@ class SixAxisForceSensor:
 		if value <= 0:
 			raise ValueError("n_per_count must be > 0")
 		self._n_per_count = value
+		self._scale = np.float32(value)
+		self._lut = None  # 标定变了，查表作废重建
+		self._apply_bias_counts()  # 偏置力向量按新标定重算
 
 	def _create_client(self) -> ModbusTcpClient:
-		kwargs = {"host": self.ip}
+		kwargs = {"host": self._resolved_ip}
 		try:
 			kwargs["port"] = self.port
 		except Exception:
@@ -96,15 +169,53 @@ class SixAxisForceSensor:
 		try:
 			return ModbusTcpClient(**kwargs)
 		except TypeError:
-			return ModbusTcpClient(self.ip)
+			return ModbusTcpClient(self._resolved_ip)
+
+	def _tune_socket(self) -> None:
+		# 关闭 Nagle：每次 Modbus 请求都远小于 MSS，Nagle+delayed-ACK 会让小包
+		# 在内核里等上几十毫秒。不同 pymodbus 版本的 socket 属性不一样，拿不到就算了。
+		sock = getattr(self._client, "socket", None)
+		if sock is None:
+			return
+		try:
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		except (AttributeError, OSError):
+			pass
+		try:
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)  # Linux only
+		except (AttributeError, OSError):
+			pass
+		# 内核层 keepalive：对端掉线 ~4 秒内发现，不用在 Python 里做重试探测。
+		try:
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 1)
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+		except (AttributeError, OSError):
+			pass
 
 	def connect(self) -> bool:
-		return bool(self._client.connect())
+		if self.use_fast_transport:
+			try:
+				if self._fast is None:
+					from _fastmodbus import FastModbusTcp
+
+					self._fast = FastModbusTcp(self._resolved_ip, port=self.port, timeout=self.timeout)
+				self._fast.connect()
+				return True
+			except Exception:
+				self._fast = None  # 建不起来就回退 pymodbus
+		ok = bool(self._client.connect())
+		if ok:
+			self._tune_socket()
+		return ok
 
 	def open(self) -> bool:
 		return self.connect()
 
 	def close(self) -> None:
+		if self._fast is not None:
+			self._fast.close()
 		try:
 			self._client.close()
 		except Exception:
@@ -124,65 +235,145 @@ class SixAxisForceSensor:
 	def bias_vector(self) -> Wrench:
 		return self._bias
 
-	def _read_u16(self, *, device_id: int, address: int) -> int:
+	def _read_registers(self, *, device_id: int, address: int, count: int = 1) -> Sequence[int]:
+		if self._fast is not None:
+			return self._fast.read_holding_registers(device_id=device_id, address=address, count=count)
+		if self._read_call is not None:
+			resp = self._read_call(device_id, address, count)
+			if resp is None or not hasattr(resp, "registers") or len(resp.registers) < count:
+				raise RuntimeError(f"read_holding_registers failed for device_id={device_id}")
+			return resp.registers
+
 		# 兼容不同 pymodbus 版本的参数名（unit/slave/device_id）以及位置参数形式。
 		last_exc: Optional[Exception] = None
 		call_variants = [
-			lambda: self._client.read_holding_registers(address, 1, unit=device_id),
-			lambda: self._client.read_holding_registers(address, 1, slave=device_id),
-			lambda: self._client.read_holding_registers(address=address, count=1, unit=device_id),
-			lambda: self._client.read_holding_registers(address=address, count=1, slave=device_id),
-			lambda: self._client.read_holding_registers(device_id=device_id, address=address),
+			lambda dev, addr, cnt: self._client.read_holding_registers(addr, cnt, unit=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(addr, cnt, slave=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(address=addr, count=cnt, unit=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(address=addr, count=cnt, slave=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(device_id=dev, address=addr, count=cnt),
 		]
 
 		for call in call_variants:
 			try:
-				resp = call()
-				if resp is None or not hasattr(resp, "registers") or not resp.registers:
-					continue
-				return int(resp.registers[0]) & 0xFFFF
+				resp = call(device_id, address, count)
 			except TypeError as exc:
 				last_exc = exc
 				continue
+			if resp is None or not hasattr(resp, "registers") or len(resp.registers) < count:
+				continue
+			self._read_call = call
+			return resp.registers
 
 		raise RuntimeError(f"read_holding_registers failed for device_id={device_id}") from last_exc
 
+	def _read_u16(self, *, device_id: int, address: int) -> int:
+		regs = self._read_registers(device_id=device_id, address=address, count=1)
+		return int(regs[0]) & 0xFFFF
+
+	def _ensure_connected(self) -> None:
+		# 每个采样只查一次连接状态；断了就同步重连一次，失败交给上层处理。
+		if self._fast is not None:
+			if not self._fast.connected:
+				self.connect()
+			return
+		if getattr(self._client, "connected", True) is False:
+			self.connect()
+
+	def _read_raw_into(self, out: np.ndarray) -> np.ndarray:
+		# 单趟把各轴原始 u16 写进预分配缓冲，不经过中间 list/tuple。
+		self._ensure_connected()
+		if self._batch_plan is not None:
+			device_id, start, count, offsets = self._batch_plan
+			regs = self._read_registers(device_id=device_id, address=start, count=count)
+			for i, off in enumerate(offsets):
+				out[i] = int(regs[off]) & 0xFFFF
+		else:
+			for i, (device_id, address) in enumerate(self._axis_plan):
+				out[i] = self._read_u16(device_id=device_id, address=address)
+		return out
+
 	def read_raw_u16(self) -> Tuple[int, ...]:
-		values = []
-		for device_id, address in zip(self.axis_device_ids, self.addresses):
-			values.append(self._read_u16(device_id=device_id, address=address))
-		return tuple(values)
+		return tuple(int(v) for v in self._read_raw_into(self._raw_buf))
+
+	def _read_counts_fast(self) -> Optional[Tuple[int, ...]]:
+		# fast transport + 批量计划时，原始响应字节直接按 '>Nh' 解析成有符号
+		# counts，省掉 .registers 列表和 u16 -> s16 两步。
+		if self._fast is None or self._batch_plan is None:
+			return None
+		self._ensure_connected()
+		if self._fast is None:  # 重连可能已回退到 pymodbus
+			return None
+		device_id, start, count, offsets = self._batch_plan
+		regs = self._fast.read_holding_registers_signed(device_id=device_id, address=start, count=count)
+		return tuple(regs[off] for off in offsets)
 
 	def read_counts(self) -> Tuple[int, ...]:
-		return tuple(_u16_to_s16(v) for v in self.read_raw_u16())
+		fast = self._read_counts_fast()
+		if fast is not None:
+			return fast
+		return _u16s_to_s16s(self.read_raw_u16())
+
+	def read_counts_np(self) -> np.ndarray:
+		fast = self._read_counts_fast()
+		if fast is not None:
+			self._counts_buf[:] = fast
+			return self._counts_buf
+		# u16 -> s16 无分支：raw - ((raw & 0x8000) << 1)，一次向量化完成。
+		raw = self._read_raw_into(self._raw_buf)
+		np.subtract(raw, (raw & 0x8000) << 1, out=self._counts_buf)
+		return self._counts_buf
+
+	def _force_lut(self) -> np.ndarray:
+		lut = self._lut
+		if lut is None:
+			# 索引是 raw u16，值是换算后的力：一次建表，之后每轴一次内存读。
+			lut = np.arange(65536, dtype=np.int32).astype(np.int16).astype(np.float32)
+			lut *= np.float32(self._n_per_count)
+			self._lut = lut
+		return lut
+
+	def _get_wrench_array(self, *, unbiased: bool = False, out: Optional[np.ndarray] = None) -> np.ndarray:
+		# 填充复用的 6 元缓冲（或调用方给的 out）并返回它；
+		# 返回内部缓冲时调用方只读，不要长期持有。
+		w = self._wrench_buf if out is None else out
+		w[:] = 0.0
+		fast = self._read_counts_fast()
+		if fast is not None:
+			n = len(fast)
+			w[:n] = fast
+			w[:n] *= self._scale
+		else:
+			raw = self._read_raw_into(self._raw_buf)
+			w[: raw.shape[0]] = self._force_lut()[raw]
+		if not unbiased:
+			np.subtract(w, self._bias_arr, out=w)
+		return w
 
 	def get_wrench(self, *, unbiased: bool = False) -> Wrench:
 		"""
 		返回力/力矩（当前实现默认只有 Fx/Fy/Fz；力矩为 0）。
 		- unbiased=True：不减 bias（等价于原始换算后的 N）
 		"""
-		counts = self.read_counts()
-		fx = (counts[0] if len(counts) > 0 else 0) * self._n_per_count
-		fy = (counts[1] if len(counts) > 1 else 0) * self._n_per_count
-		fz = (counts[2] if len(counts) > 2 else 0) * self._n_per_count
-		wrench = Wrench(fx, fy, fz, 0.0, 0.0, 0.0)
-		if unbiased:
-			return wrench
-		return Wrench(
-			wrench.fx - self._bias.fx,
-			wrench.fy - self._bias.fy,
-			wrench.fz - self._bias.fz,
-			wrench.tx - self._bias.tx,
-			wrench.ty - self._bias.ty,
-			wrench.tz - self._bias.tz,
-		)
+		w = self._get_wrench_array(unbiased=unbiased)
+		return Wrench(float(w[0]), float(w[1]), float(w[2]), float(w[3]), float(w[4]), float(w[5]))
 
 	def get_force_torque(self, *, unbiased: bool = False) -> Tuple[float, float, float, float, float, float]:
-		return self.get_wrench(unbiased=unbiased).as_tuple()
+		w = self._get_wrench_array(unbiased=unbiased)
+		return (float(w[0]), float(w[1]), float(w[2]), float(w[3]), float(w[4]), float(w[5]))
 
 	def get_forces(self, *, unbiased: bool = False) -> Tuple[float, float, float]:
-		w = self.get_wrench(unbiased=unbiased)
-		return w.fx, w.fy, w.fz
+		w = self._get_wrench_array(unbiased=unbiased)
+		return float(w[0]), float(w[1]), float(w[2])
+
+	def get_wrench_into(self, out: np.ndarray, *, unbiased: bool = False) -> np.ndarray:
+		"""
+		把一次采样直接写进调用方自带的 6 元数组并返回它（仿 NumPy 的 out= 约定）。
+		控制环可以常驻一个向量反复传入，整条热路径每周期零分配。
+		"""
+		if out.shape != (6,):
+			raise ValueError("out must be a 6-element array")
+		return self._get_wrench_array(unbiased=unbiased, out=out)
 
 	def bias(self, *, samples: int = 20, delay_s: float = 0.0) -> Wrench:
 		"""
@@ -191,22 +382,72 @@ class SixAxisForceSensor:
 		if samples <= 0:
 			raise ValueError("samples must be > 0")
 
-		sum_fx = 0.0
-		sum_fy = 0.0
-		sum_fz = 0.0
-		for _ in range(samples):
-			w = self.get_wrench(unbiased=True)
-			sum_fx += w.fx
-			sum_fy += w.fy
-			sum_fz += w.fz
+		# 采样只收 counts，攒进 (N, axes) 缓冲，最后一次向量化求均值并取整到
+		# int16 counts（量程本来就不超过 ±32768 counts，量化误差 < 半个 count），
+		# 循环里没有 Wrench 构造也没有逐样本的 Python 累加。
+		buf = np.empty((samples, len(self.axis_device_ids)), dtype=np.int32)
+		read_counts_np = self.read_counts_np
+		sleep = time.sleep
+		for i in range(samples):
+			buf[i] = read_counts_np()
 			if delay_s > 0:
-				time.sleep(delay_s)
+				sleep(delay_s)
 
-		self._bias = Wrench(sum_fx / samples, sum_fy / samples, sum_fz / samples, 0.0, 0.0, 0.0)
+		self._bias_counts[:] = np.rint(buf.mean(axis=0)).astype(np.int16)
+		self._apply_bias_counts()
 		return self._bias
 
+	def _apply_bias_counts(self) -> None:
+		self._bias_arr[:] = 0.0
+		n = self._bias_counts.shape[0]
+		self._bias_arr[:n] = self._bias_counts.astype(np.float32) * self._scale
+		self._bias = Wrench(*(float(v) for v in self._bias_arr))
+
 	def unbias(self) -> None:
-		self._bias = Wrench(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+		self._bias_counts[:] = 0
+		self._apply_bias_counts()
+
+	def start_streaming(self, *, period_s: float = 0.0) -> None:
+		"""
+		起一个 daemon 线程持续采样，把最新 wrench 写进单槽缓冲；
+		随后用 get_latest_wrench() 取值，用户侧节奏和传感器 RTT 解耦。
+		"""
+		if self._stream_thread is not None:
+			return
+		self._stream_run = True
+		self._stream_thread = threading.Thread(
+			target=self._stream_loop, args=(period_s,), daemon=True
+		)
+		self._stream_thread.start()
+
+	def stop_streaming(self, *, timeout: float = 1.0) -> None:
+		self._stream_run = False
+		t = self._stream_thread
+		if t is not None:
+			t.join(timeout)
+			self._stream_thread = None
+
+	def _stream_loop(self, period_s: float) -> None:
+		get_arr = self._get_wrench_array
+		lock = self._latest_lock
+		latest = self._latest
+		sleep = time.sleep
+		while self._stream_run:
+			try:
+				arr = get_arr()
+			except Exception:
+				sleep(period_s if period_s > 0 else 0.05)  # 出错别空转
+				continue
+			with lock:
+				latest[:] = arr
+			if period_s > 0:
+				sleep(period_s)
+
+	def get_latest_wrench(self) -> Wrench:
+		"""返回后台线程最近一次采样的快照；没在 streaming 时是全零。"""
+		with self._latest_lock:
+			fx, fy, fz, tx, ty, tz = (float(v) for v in self._latest)
+		return Wrench(fx, fy, fz, tx, ty, tz)
 
 	# 兼容你之前的命名
 	def tare(self, *, samples: int = 20, delay_s: float = 0.0) -> Wrench:
@@ -216,10 +457,147 @@ class SixAxisForceSensor:
 		self.unbias()
 
 
+class AsyncSixAxisForceSensor(SixAxisForceSensor):
+	"""
+	异步版本：三路轴读取用 asyncio.gather 并发发出，3 个串行 RTT 压成 ~1 个。
+	只用 a 前缀的方法（aconnect/aread_.../aget_...）；同步方法在这个类上不可用。
+	"""
+
+	def _create_client(self):
+		from pymodbus.client import AsyncModbusTcpClient
+
+		kwargs = {"host": self._resolved_ip, "port": self.port}
+		if self.timeout is not None:
+			kwargs["timeout"] = self.timeout
+		try:
+			return AsyncModbusTcpClient(**kwargs)
+		except TypeError:
+			return AsyncModbusTcpClient(self._resolved_ip)
+
+	async def aconnect(self) -> bool:
+		ok = bool(await self._client.connect())
+		if ok:
+			self._tune_socket()
+		return ok
+
+	async def aclose(self) -> None:
+		try:
+			result = self._client.close()
+			if asyncio.iscoroutine(result):
+				await result
+		except Exception:
+			pass
+
+	async def __aenter__(self) -> "AsyncSixAxisForceSensor":
+		await self.aconnect()
+		return self
+
+	async def __aexit__(self, exc_type, exc, tb) -> None:
+		await self.aclose()
+
+	async def _aread_registers(self, *, device_id: int, address: int, count: int = 1) -> Sequence[int]:
+		if self._read_call is not None:
+			resp = await self._read_call(device_id, address, count)
+			if resp is None or not hasattr(resp, "registers") or len(resp.registers) < count:
+				raise RuntimeError(f"read_holding_registers failed for device_id={device_id}")
+			return resp.registers
+
+		last_exc: Optional[Exception] = None
+		call_variants = [
+			lambda dev, addr, cnt: self._client.read_holding_registers(addr, cnt, unit=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(addr, cnt, slave=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(address=addr, count=cnt, unit=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(address=addr, count=cnt, slave=dev),
+			lambda dev, addr, cnt: self._client.read_holding_registers(device_id=dev, address=addr, count=cnt),
+		]
+		for call in call_variants:
+			try:
+				resp = await call(device_id, address, count)
+			except TypeError as exc:
+				last_exc = exc
+				continue
+			if resp is None or not hasattr(resp, "registers") or len(resp.registers) < count:
+				continue
+			self._read_call = call
+			return resp.registers
+		raise RuntimeError(f"read_holding_registers failed for device_id={device_id}") from last_exc
+
+	async def aread_raw_u16(self) -> Tuple[int, ...]:
+		if self._batch_plan is not None:
+			device_id, start, count, offsets = self._batch_plan
+			regs = await self._aread_registers(device_id=device_id, address=start, count=count)
+			return tuple(int(regs[off]) & 0xFFFF for off in offsets)
+		results = await asyncio.gather(
+			*(
+				self._aread_registers(device_id=device_id, address=address)
+				for device_id, address in self._axis_plan
+			)
+		)
+		return tuple(int(regs[0]) & 0xFFFF for regs in results)
+
+	async def aread_counts(self) -> Tuple[int, ...]:
+		return _u16s_to_s16s(await self.aread_raw_u16())
+
+	async def aget_wrench(self, *, unbiased: bool = False) -> Wrench:
+		counts = await self.aread_counts()
+		fx = (counts[0] if len(counts) > 0 else 0) * self._n_per_count
+		fy = (counts[1] if len(counts) > 1 else 0) * self._n_per_count
+		fz = (counts[2] if len(counts) > 2 else 0) * self._n_per_count
+		wrench = Wrench(fx, fy, fz, 0.0, 0.0, 0.0)
+		if unbiased:
+			return wrench
+		return Wrench(
+			wrench.fx - self._bias.fx,
+			wrench.fy - self._bias.fy,
+			wrench.fz - self._bias.fz,
+			wrench.tx - self._bias.tx,
+			wrench.ty - self._bias.ty,
+			wrench.tz - self._bias.tz,
+		)
+
+	async def aget_forces(self, *, unbiased: bool = False) -> Tuple[float, float, float]:
+		w = await self.aget_wrench(unbiased=unbiased)
+		return w.fx, w.fy, w.fz
+
+	async def abias(self, *, samples: int = 20, delay_s: float = 0.0) -> Wrench:
+		if samples <= 0:
+			raise ValueError("samples must be > 0")
+		# 与同步版一致：以 int16 counts 为偏置的权威存储。
+		buf = np.empty((samples, len(self.axis_device_ids)), dtype=np.int32)
+		aread_counts = self.aread_counts
+		asleep = asyncio.sleep
+		for i in range(samples):
+			buf[i] = await aread_counts()
+			if delay_s > 0:
+				await asleep(delay_s)
+		self._bias_counts[:] = np.rint(buf.mean(axis=0)).astype(np.int16)
+		self._apply_bias_counts()
+		return self._bias
+
+
+async def _amain() -> None:
+	sensor = AsyncSixAxisForceSensor("10.10.10.2", address=0, axis_device_ids=(1, 2, 3))
+	await sensor.aconnect()
+	# 循环外把方法/函数查好，循环体里只剩调用；unbiased=False 本来就是默认值。
+	aget_forces = sensor.aget_forces
+	asleep = asyncio.sleep
+	monotonic = time.monotonic
+	period = 0.02
+	# 按绝对截止时间调度：睡的是「到下一拍还剩多少」，读取耗时不会让周期漂移。
+	next_t = monotonic() + period
+	try:
+		while True:
+			fx, fy, fz = await aget_forces()
+			print(f"Fx={fx:.3f}N, Fy={fy:.3f}N, Fz={fz:.3f}N")
+			dt = next_t - monotonic()
+			if dt > 0:
+				await asleep(dt)
+				next_t += period
+			else:
+				next_t = monotonic() + period  # 已经落后，就从现在重新起拍
+	finally:
+		await sensor.aclose()
+
+
 if __name__ == "__main__":
-	sensor = SixAxisForceSensor("10.10.10.2", address=0, axis_device_ids=(1, 2, 3))
-	sensor.connect()
-	while True:
-		fx, fy, fz = sensor.get_forces(unbiased=False)
-		print(f"Fx={fx:.3f}N, Fy={fy:.3f}N, Fz={fz:.3f}N")
-		time.sleep(0.02)
+	asyncio.run(_amain())